@@ -1,3 +1,6 @@
+import time
+startup_start = time.perf_counter()
+
 import wx
 import pytesseract
 from PIL import Image, ImageFilter, ImageOps, ImageEnhance
@@ -21,6 +24,26 @@ if getattr(sys, 'frozen', False):
 else:
     application_path = os.path.dirname(os.path.abspath(__file__))
 
+class StartupTimer:
+    def __init__(self, start):
+        self.start = start
+        self.last = start
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self):
+        print("Startup timing:")
+        for phase, elapsed in self.phases:
+            print(f"  {phase}: {elapsed * 1000:.1f} ms")
+        print(f"  Time to interactive: {(self.last - self.start) * 1000:.1f} ms")
+
+startup_timer = StartupTimer(startup_start)
+startup_timer.mark("Imports")
+
 class TesseractPathFrame(wx.Frame):
     def __init__(self, parent, title):
         super(TesseractPathFrame, self).__init__(parent, title=title, size=(400, 150))
@@ -90,7 +113,8 @@ def set_tesseract_path(parent_frame):
     generic_path = r'C:/Program Files/Tesseract-OCR/tesseract.exe'
     if os.path.isfile(generic_path):
         pytesseract.pytesseract.tesseract_cmd = generic_path
-        save_tesseract_path(generic_path)  # Save this path for future use
+        if load_tesseract_path() != generic_path:
+            save_tesseract_path(generic_path)  # Save this path for future use
         return
     
     # If not found, try loading the saved path
@@ -108,9 +132,19 @@ class Challenge:
         self.image_id = image_id
 
 class ChallengeManager:
-    def __init__(self):
-        self.challenges_by_image = {}
-        self.load_challenges_from_file()
+    def __init__(self, filename='challenges_info.json'):
+        self.filename = filename
+        self._challenges_by_image = None
+
+    @property
+    def challenges_by_image(self):
+        self.ensure_loaded()
+        return self._challenges_by_image
+
+    def ensure_loaded(self):
+        # Read the saved challenges the first time they are needed rather than at import
+        if self._challenges_by_image is None:
+            self.load_challenges_from_file()
 
     def add_challenge(self, challenge_text, image_id):
         if image_id not in self.challenges_by_image:
@@ -146,22 +180,33 @@ class ChallengeManager:
                     del self.challenges_by_image[image_id]
                 break
     
-    def save_challenges_to_file(self, filename='challenges_info.json'):
+    def save_challenges_to_file(self, filename=None):
+        filename = filename or self.filename
         data = {image_id: [{'text': challenge.text, 'completed': challenge.completed} for challenge in challenges] for image_id, challenges in self.challenges_by_image.items()}
         with open(filename, 'w') as f:
             json.dump(data, f, indent=4)
 
-    def load_challenges_from_file(self, filename='challenges_info.json'):
+    def load_challenges_from_file(self, filename=None):
+        filename = filename or self.filename
         try:
             with open(filename, 'r') as f:
                 data_loaded = json.load(f)
-                for image_id, challenges in data_loaded.items():
-                    for challenge in challenges:
-                        self.add_challenge(challenge['text'], image_id)
-                        if challenge['completed']:
-                            self.mark_completed(challenge['text'], image_id, True)
         except FileNotFoundError:
-            pass
+            data_loaded = {}
+
+        # Build each image's list in one pass instead of replaying add/mark per record
+        challenges_by_image = {}
+        for image_id, challenges in data_loaded.items():
+            image_challenges = {}
+            for record in challenges:
+                challenge = image_challenges.get(record['text'])
+                if challenge is None:
+                    challenge = image_challenges[record['text']] = Challenge(record['text'], image_id)
+                if record['completed']:
+                    challenge.completed = True
+            if image_challenges:
+                challenges_by_image[image_id] = list(image_challenges.values())
+        self._challenges_by_image = challenges_by_image
 
 challenge_manager = ChallengeManager()
 
@@ -201,8 +246,6 @@ class ChallengesTab(wx.ScrolledWindow):
         self.selectedChallengeText = None
         self.selectedChallengeImageId = None
 
-        self.main_frame.updateIdentifiedChallenges()
-
         self.SetScrollRate(5, 5)
         self.initUI()
 
@@ -211,9 +254,9 @@ class ChallengesTab(wx.ScrolledWindow):
 
         self.lastSelectedChallenge = {}
         self.checkListDict = {}
-        self.updateChallengesUI()
+        # The list is populated by MainFrame.finishStartup once the window is shown
 
-    def updateChallengesUI(self):
+    def updateChallengesUI(self, save=True):
 
         self.sizer.Clear(True)
 
@@ -240,7 +283,8 @@ class ChallengesTab(wx.ScrolledWindow):
         self.Layout()
         self.FitInside()
 
-        self.challenge_manager.save_challenges_to_file()
+        if save:
+            self.challenge_manager.save_challenges_to_file()
 
     def onSelectChallenge(self, event):
         check_list_box = event.GetEventObject()
@@ -349,8 +393,6 @@ class MainFrame(wx.Frame):
         self.SetSize(size)
         self.InitUI()
 
-        self.challenge_manager.load_challenges_from_file()
-
     def InitUI(self):
 
         self.panel = wx.Panel(self)
@@ -403,6 +445,17 @@ class MainFrame(wx.Frame):
 
         self.imagePaths = []  # Store uploaded image paths
 
+    def finishStartup(self):
+        # Deferred with wx.CallAfter so loading and ranking happen after the first paint
+        startup_timer.mark("Event loop / first paint")
+        self.challenge_manager.ensure_loaded()
+        startup_timer.mark("Load challenges")
+        self.challengesTab.updateChallengesUI(save=False)
+        startup_timer.mark("Populate challenges tab")
+        self.updateIdentifiedChallenges()
+        startup_timer.mark("Rank characters")
+        startup_timer.report()
+
     def OnTabChanged(self, event):
         # Show or hide action buttons based on the selected tab
         if isinstance(self.notebook.GetCurrentPage(), ChallengesTab):
@@ -647,10 +700,16 @@ class MainFrame(wx.Frame):
 
 def main():
     app = wx.App(False)
+    startup_timer.mark("Create app")
     frame = MainFrame(None, -1, 'Brawlhalla Challenge Extractor', size=(800, 400), challenge_manager=challenge_manager)
+    startup_timer.mark("Build main window")
     frame.Show(True)
+    frame.Update()
+    startup_timer.mark("Show main window")
 
     set_tesseract_path(frame)
+    startup_timer.mark("Tesseract path")
+    wx.CallAfter(frame.finishStartup)
     app.MainLoop()
 
 if __name__ == '__main__':